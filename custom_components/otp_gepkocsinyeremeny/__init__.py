@@ -1,20 +1,34 @@
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from .const import DOMAIN, CONF_NUMBERS
+from homeassistant.core import HomeAssistant, ServiceCall
+from .const import DOMAIN, CONF_NUMBERS, SERVICE_PROFILE, ATTR_REFRESHES, ATTR_TOP
 from .coordinator import OTPCoordinator
 
 PLATFORMS = ["sensor", "button"]
 
+PROFILE_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_REFRESHES, default=1): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+    vol.Optional(ATTR_TOP, default=20): vol.All(vol.Coerce(int), vol.Range(min=1, max=200)),
+})
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Integráció beállítása."""
     hass.data.setdefault(DOMAIN, {})
-    
+
     numbers = entry.data.get(CONF_NUMBERS, "")
-    coordinator = OTPCoordinator(hass, numbers)
+    coordinator = OTPCoordinator(hass, numbers, entry)
     await coordinator.async_config_entry_first_refresh()
-    
+
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    if not hass.services.has_service(DOMAIN, SERVICE_PROFILE):
+        async def handle_profile(call: ServiceCall):
+            """Profilozás élesítése az összes bejegyzés következő frissítéseire."""
+            for coord in hass.data[DOMAIN].values():
+                coord.profiler.arm(call.data[ATTR_REFRESHES], call.data[ATTR_TOP])
+
+        hass.services.async_register(DOMAIN, SERVICE_PROFILE, handle_profile, schema=PROFILE_SCHEMA)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(update_listener))
     return True
@@ -23,6 +37,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Eltávolítás."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
+        if not hass.data[DOMAIN]:
+            hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
     return unload_ok
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
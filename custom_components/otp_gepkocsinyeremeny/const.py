@@ -2,3 +2,8 @@ DOMAIN = "otp_gepkocsinyeremeny"
 CONF_NUMBERS = "numbers"
 CONF_NAME = "name"
 DEFAULT_NAME = "OTP Betétek"
+
+SERVICE_PROFILE = "profile"
+ATTR_REFRESHES = "refreshes"
+ATTR_TOP = "top"
+PROFILE_DIR = "otp_gepkocsinyeremeny_profiles"
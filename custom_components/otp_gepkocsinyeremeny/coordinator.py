@@ -12,6 +12,7 @@ import holidays
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.components import persistent_notification
 from .const import DOMAIN, CONF_NUMBERS
+from .profiler import OTPProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,7 +22,7 @@ URL = "https://www.otpbank.hu/portal/hu/megtakaritas/forint-betetek/gepkocsinyer
 class OTPCoordinator(DataUpdateCoordinator):
     """Adatok kezelése és frissítése."""
 
-    def __init__(self, hass, numbers_str):
+    def __init__(self, hass, numbers_str, entry):
         """Inicializálás."""
         super().__init__(
             hass,
@@ -111,6 +112,7 @@ class OTPCoordinator(DataUpdateCoordinator):
         self._history = []
         self._checked_pdfs = []
         self._all_winners = {}
+        self.profiler = OTPProfiler(hass, entry.entry_id, entry.title)
 
     async def _extract_text_from_pdf(self, session, url):
         """Letölti és kinyeri a szöveget egy PDF-ből pypdf segítségével."""
@@ -133,7 +135,7 @@ class OTPCoordinator(DataUpdateCoordinator):
                         extracted += page.extract_text() + "\n"
                     return extracted
 
-                text = await self.hass.async_add_executor_job(parse_pdf)
+                text = await self.profiler.async_add_executor_job(parse_pdf)
                 
             except ImportError:
                 _LOGGER.error("A pypdf könyvtár nem található!")
@@ -231,7 +233,7 @@ class OTPCoordinator(DataUpdateCoordinator):
             return history, checked, all_winners
 
         _LOGGER.info("Adatok betöltése fájlokból...")
-        self._history, self._checked_pdfs, self._all_winners = await self.hass.async_add_executor_job(load)
+        self._history, self._checked_pdfs, self._all_winners = await self.profiler.async_add_executor_job(load)
         _LOGGER.info(f"Adatok betöltve: {len(self._history)} korábbi találat, {len(self._all_winners)} sorsolás a gyorsítótárban.")
 
     async def _async_save_files(self):
@@ -242,7 +244,7 @@ class OTPCoordinator(DataUpdateCoordinator):
             with open(self._all_winners_file, 'w') as f: json.dump(self._all_winners, f, indent=2)
 
         _LOGGER.info("Adatok mentése fájlba...")
-        await self.hass.async_add_executor_job(save)
+        await self.profiler.async_add_executor_job(save)
         _LOGGER.info("Adatok sikeresen elmentve.")
 
     async def _scan_historical_pdfs(self, session, html_content):
@@ -333,7 +335,13 @@ class OTPCoordinator(DataUpdateCoordinator):
              self.hass.async_create_task(self._async_save_files())
     
     async def _async_update_data(self):
-        """Adatok frissítése."""
+        """Adatok frissítése (élesített profilozás esetén mérve)."""
+        if self.profiler.armed:
+            return await self.profiler.async_profile(self._async_fetch_data)
+        return await self._async_fetch_data()
+
+    async def _async_fetch_data(self):
+        """Adatok lekérése és feldolgozása."""
         _LOGGER.info("OTP Gépkocsinyeremény adatfrissítés indítása...")
         
         if not self._all_winners:
@@ -0,0 +1,170 @@
+"""Igény szerinti profilozás a frissítési folyamathoz."""
+import cProfile
+import io
+import logging
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from .const import PROFILE_DIR
+
+_LOGGER = logging.getLogger(__name__)
+
+# Egyszerre csak egy profilozott frissítés futhat a teljes folyamatban
+# (a cProfile és a tracemalloc is globális), ezért a jelző minden példányé közös.
+_PROFILING = False
+
+
+class OTPProfiler:
+    """A következő N frissítés profilozása (cProfile + executor időmérés + memória)."""
+
+    def __init__(self, hass, entry_id, title):
+        """Inicializálás."""
+        self.hass = hass
+        self._entry_id = entry_id
+        self._title = title
+        self._remaining = 0
+        self._top = 20
+        self._active = False
+        self._executor_jobs = []
+
+    @property
+    def armed(self):
+        """Van-e még hátralévő profilozandó frissítés."""
+        return self._remaining > 0
+
+    def arm(self, refreshes, top):
+        """Profilozás élesítése a következő `refreshes` frissítésre."""
+        self._remaining = refreshes
+        self._top = top
+        _LOGGER.info(f"Profilozás élesítve ({self._title}): következő {refreshes} frissítés, top {top} pont.")
+
+    async def async_add_executor_job(self, target, *args):
+        """Executor feladat futtatása, aktív profilozás esetén időméréssel."""
+        if not self._active:
+            return await self.hass.async_add_executor_job(target, *args)
+        name = getattr(target, "__qualname__", repr(target))
+        start = time.perf_counter()
+        try:
+            return await self.hass.async_add_executor_job(target, *args)
+        finally:
+            self._executor_jobs.append((name, time.perf_counter() - start))
+
+    async def async_profile(self, target):
+        """Egy frissítés futtatása profilozva."""
+        global _PROFILING
+        if _PROFILING:
+            _LOGGER.info(f"Másik profilozás fut, a frissítés profilozás nélkül fut ({self._title}).")
+            return await target()
+
+        if sys.version_info < (3, 12) and sys.getprofile() is not None:
+            # Python 3.12 előtt az enable() nem jelez hibát, hanem átveszi a futó profiler helyét
+            _LOGGER.warning(f"Profilozás nem indítható ({self._title}): másik profiler már aktív")
+            return await target()
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as err:
+            # Python 3.12+ alatt egyszerre csak egy profiler lehet aktív (pl. a HA profiler.start)
+            _LOGGER.warning(f"Profilozás nem indítható ({self._title}): {err}")
+            return await target()
+
+        _PROFILING = True
+        self._active = True
+        self._executor_jobs = []
+        started_tracemalloc = False
+        try:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(1)
+                started_tracemalloc = True
+            tracemalloc.reset_peak()
+        except Exception as err:
+            profile.disable()
+            self._active = False
+            if started_tracemalloc:
+                tracemalloc.stop()
+            _PROFILING = False
+            _LOGGER.warning(f"Memóriakövetés nem indítható ({self._title}): {err}")
+            return await target()
+
+        self._remaining -= 1
+        start = time.perf_counter()
+        try:
+            return await target()
+        finally:
+            profile.disable()
+            self._active = False
+            duration = time.perf_counter() - start
+            current, peak = tracemalloc.get_traced_memory()
+            self.hass.async_create_task(
+                self._async_write_report(profile, duration, current, peak, started_tracemalloc)
+            )
+
+    async def _async_write_report(self, profile, duration, current, peak, started_tracemalloc):
+        """Profil fájlok és összefoglaló mentése a konfigurációs mappába."""
+        global _PROFILING
+        executor_jobs = list(self._executor_jobs)
+        top = self._top
+        remaining = self._remaining
+        directory = self.hass.config.path(PROFILE_DIR)
+        prefix = os.path.join(
+            directory, f"refresh_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{self._entry_id}"
+        )
+
+        def snapshot():
+            try:
+                return tracemalloc.take_snapshot()
+            finally:
+                if started_tracemalloc:
+                    tracemalloc.stop()
+
+        def write(snap):
+            os.makedirs(directory, exist_ok=True)
+            profile.dump_stats(f"{prefix}.prof")
+
+            out = io.StringIO()
+            out.write(f"OTP Gépkocsinyeremény frissítés profil - {self._title} ({self._entry_id})\n")
+            out.write(f"Időtartam: {duration:.3f} s\n")
+            out.write(f"Memória (tracemalloc, teljes folyamat): a frissítés végén {current / 1024:.1f} KiB, csúcs {peak / 1024:.1f} KiB\n")
+            out.write(
+                "Megjegyzés: a profil nem csak az _async_update_data költségét mutatja. "
+                "Python 3.12+ alatt a folyamat minden szálát rögzíti (executor, recorder, más integrációk), "
+                "régebbi Pythonon az eseményhurok többi, közben futó feladatát is.\n\n"
+            )
+
+            out.write(f"Executor feladatok ({len(executor_jobs)} db, {sum(d for _, d in executor_jobs):.3f} s):\n")
+            for name, job_duration in sorted(executor_jobs, key=lambda j: j[1], reverse=True):
+                out.write(f"  {job_duration:8.3f} s  {name}\n")
+
+            out.write(f"\nProfil a frissítés alatt - top {top} (kumulatív idő):\n")
+            pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(top)
+            out.write(f"Profil a frissítés alatt - top {top} (saját idő):\n")
+            pstats.Stats(profile, stream=out).sort_stats("tottime").print_stats(top)
+
+            out.write(f"A frissítés végén még lefoglalt memória - top {top} (sor szerint, nem a csúcs bontása):\n")
+            filtered = snap.filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            ))
+            for stat in filtered.statistics("lineno")[:top]:
+                out.write(f"  {stat}\n")
+
+            with open(f"{prefix}_summary.txt", "w") as f:
+                f.write(out.getvalue())
+
+        try:
+            snap = await self.hass.async_add_executor_job(snapshot)
+            await self.hass.async_add_executor_job(write, snap)
+        except Exception as err:
+            _LOGGER.error(f"Profil mentése sikertelen ({self._title}): {err}")
+            return
+        finally:
+            _PROFILING = False
+        _LOGGER.info(
+            f"Frissítés profil elmentve ({duration:.3f} s, memória csúcs {peak / 1024:.1f} KiB): "
+            f"{prefix}_summary.txt, hátralévő profilozott frissítés: {remaining}"
+        )